@@ -12,9 +12,13 @@ Usage:
     python app.py
 """
 
-import queue
+import ctypes
+import os
+import sys
 import threading
+import time
 import tkinter as tk
+from collections import deque
 from datetime import datetime
 from tkinter import messagebox, ttk
 from typing import Any
@@ -26,11 +30,14 @@ from PIL import Image, ImageTk
 from detector import ObjectDetector
 
 # ── Layout constants ───────────────────────────────────────────────────────────
-_VIDEO_W = 800          # Default display width  (pixels)
-_VIDEO_H = 600          # Default display height (pixels)
+_VIDEO_W = 640          # Default display width  (pixels)
+_VIDEO_H = 480          # Default display height (pixels)
+_CAP_W   = 640          # Requested webcam width  (close to YOLO's native input size)
+_CAP_H   = 480          # Requested webcam height
 _CTRL_W  = 230          # Fixed width of the right-hand control panel
 _POLL_MS = 15           # GUI frame-poll interval  (~67 fps upper-bound)
-_Q_SIZE  = 2            # Keep queue tiny to minimise display latency
+_N_BUFS  = 3            # Display buffers: latest + one being shown + one being written
+_LOG_S   = 0.5          # Minimum seconds between detection log entries
 
 
 # ── Colour scheme (Catppuccin-inspired dark palette) ──────────────────────────
@@ -55,10 +62,15 @@ class App:
     Threading model
     ---------------
     - **Main thread**   : Tkinter event loop + ``_consume_frames()`` polling.
-    - **Capture thread**: ``_capture_loop()`` — reads webcam, runs YOLO,
-                          pushes (rgb_frame, detections, fps) into a small Queue.
-    The Queue has ``maxsize=_Q_SIZE`` so the capture thread automatically drops
-    stale frames when the GUI can't keep up.
+    - **Capture thread**: ``_capture_loop()`` — grabs webcam frames and decodes
+                          them alternately into two ping-pong buffers.
+    - **Inference thread**: ``_infer_loop()`` — runs YOLO on the filled buffer
+                          while the other one is being captured, then
+                          publishes (rgbx_frame, detections, fps) to a
+                          single-slot ``deque``.
+    Each ping-pong buffer has a *free* and a *ready* ``Event`` for the
+    producer/consumer handshake. The deque has ``maxlen=1`` so each new frame
+    silently replaces a stale one the GUI hasn't picked up yet.
     """
 
     MODELS = ["yolov8n", "yolov8s", "yolov8m", "yolov8l", "yolov8x"]
@@ -72,9 +84,31 @@ class App:
         # Application state
         self._running = False
         self._cap: cv2.VideoCapture | None = None
-        self._thread: threading.Thread | None = None
-        self._queue: queue.Queue = queue.Queue(maxsize=_Q_SIZE)
-        self._current_frame: np.ndarray | None = None  # latest annotated BGR frame (for screenshots)
+        self._threads: list[threading.Thread] = []
+        self._loader: threading.Thread | None = None   # model loading, off the Tk thread
+        self._load_error: Exception | None = None
+        self._latest: deque[tuple[np.ndarray, list[tuple], float]] = deque(maxlen=1)
+        # Screenshots: the inference thread copies the next annotated BGR frame
+        # only when asked, and the GUI thread writes it to disk
+        self._shot_requested = False
+        self._shot_frame: np.ndarray | None = None
+
+        self._last_log_ts = 0.0     # perf_counter() of the last detection log entry
+
+        # Ping-pong capture buffers (sized once the camera is open) plus the
+        # events the capture and inference threads hand them over with
+        self._frame_bufs: list[np.ndarray] = []
+        self._buf_free  = [threading.Event(), threading.Event()]
+        self._buf_ready = [threading.Event(), threading.Event()]
+
+        # Preallocated display buffers, cycled by the inference thread so that
+        # preparing a frame never allocates and never overwrites a published one.
+        # They are RGBX so PIL can wrap them without a stride/format conversion,
+        # and are reallocated only when the video panel changes size.
+        self._scaled_buf = np.empty((_VIDEO_H, _VIDEO_W, 3), np.uint8)
+        self._rgbx_bufs = [np.empty((_VIDEO_H, _VIDEO_W, 4), np.uint8) for _ in range(_N_BUFS)]
+        self._buf_idx = 0
+        self._display_size = (_VIDEO_W, _VIDEO_H)  # space inside the video label, kept by <Configure>
 
         self._detector = ObjectDetector()
 
@@ -128,6 +162,13 @@ class App:
             width=_VIDEO_W, height=_VIDEO_H,
         )
         self._video_lbl.pack(fill=tk.BOTH, expand=True)
+        self._video_lbl.bind("<Configure>", self._on_video_resize)
+
+        # One PhotoImage is reused for every frame via paste(); it is only
+        # recreated when the display size changes. Holding it on self also
+        # stops the garbage collector deleting it before Tkinter renders it.
+        self._photo = ImageTk.PhotoImage(Image.new("RGB", (_VIDEO_W, _VIDEO_H)))
+        self._photo_shown = False
 
     # ── Control panel ──────────────────────────────────────────────────────────
 
@@ -186,6 +227,20 @@ class App:
         tk.Label(frm, text="n=fastest  x=most accurate",
                  font=("Helvetica", 7), fg=_C["subtext"], bg=_C["surface"]).pack()
 
+        self._precision_var = tk.StringVar(value="FP16")
+        ttk.Combobox(frm, textvariable=self._precision_var,
+                     values=ObjectDetector.PRECISIONS, state="readonly", width=17).pack(pady=(4, 0))
+
+        tk.Label(frm, text="TensorRT (GPU) / OpenVINO (CPU)",
+                 font=("Helvetica", 7), fg=_C["subtext"], bg=_C["surface"]).pack()
+
+        self._imgsz_var = tk.StringVar(value="480")
+        ttk.Combobox(frm, textvariable=self._imgsz_var,
+                     values=ObjectDetector.IMGSZS, state="readonly", width=17).pack(pady=(4, 0))
+
+        tk.Label(frm, text="input size: smaller=faster",
+                 font=("Helvetica", 7), fg=_C["subtext"], bg=_C["surface"]).pack()
+
     def _build_conf_section(self, parent: tk.Frame) -> None:
         frm = self._labeled_frame(parent, "Confidence Threshold")
         frm.pack(fill=tk.X, padx=8, pady=5)
@@ -254,6 +309,12 @@ class App:
     # Event handlers
     # ══════════════════════════════════════════════════════════════════════════
 
+    def _on_video_resize(self, event: tk.Event) -> None:
+        # Only the area inside the border is available to the image
+        inset = 2 * (int(self._video_lbl.cget("borderwidth"))
+                     + int(self._video_lbl.cget("highlightthickness")))
+        self._display_size = (max(event.width - inset, 1), max(event.height - inset, 1))
+
     def _on_conf_change(self, value: str) -> None:
         threshold = float(value)
         self._conf_lbl.config(text=f"{threshold:.2f}")
@@ -264,22 +325,44 @@ class App:
     # ══════════════════════════════════════════════════════════════════════════
 
     def start_camera(self) -> None:
-        """Load the selected model, open the webcam, and begin detection."""
-        if self._running:
+        """Load the selected model in the background, then begin detection."""
+        if self._running or self._loader is not None:
             return
 
         model_name = self._model_var.get()
+        precision  = self._precision_var.get()
+        imgsz      = int(self._imgsz_var.get())
         self._set_status(text=f"Loading {model_name}…", color=_C["yellow"])
         self._statusbar.config(text=f"Downloading / loading {model_name} — please wait…")
-        self.root.update_idletasks()
+        self._start_btn.config(state=tk.DISABLED)
 
-        # Load model (may download .pt on first use)
+        # Load model off the Tk thread (may download .pt and export it on
+        # first use, which can take minutes) and poll for it to finish
+        self._load_error = None
+        self._loader = threading.Thread(target=self._load_model,
+                                        args=(model_name, precision, imgsz), daemon=True)
+        self._loader.start()
+        self.root.after(100, self._finish_start, model_name, precision, imgsz)
+
+    def _load_model(self, model_name: str, precision: str, imgsz: int) -> None:
+        """Runs in the loader thread; any error is handed to ``_finish_start()``."""
         try:
-            self._detector.load_model(model_name)
+            self._detector.load_model(model_name, precision=precision, imgsz=imgsz)
         except Exception as exc:
-            messagebox.showerror("Model Error", f"Could not load model:\n{exc}")
+            self._load_error = exc
+
+    def _finish_start(self, model_name: str, precision: str, imgsz: int) -> None:
+        """Once the model is loaded, open the webcam and begin detection."""
+        if self._loader is not None and self._loader.is_alive():
+            self.root.after(100, self._finish_start, model_name, precision, imgsz)
+            return
+        self._loader = None
+
+        if self._load_error is not None:
+            messagebox.showerror("Model Error", f"Could not load model:\n{self._load_error}")
             self._set_status(text="Stopped", color=_C["red"])
             self._statusbar.config(text="Model load failed.")
+            self._start_btn.config(state=tk.NORMAL)
             return
 
         # Open webcam
@@ -290,37 +373,53 @@ class App:
                                  "Make sure no other application is using it.")
             self._cap = None
             self._set_status(text="Stopped", color=_C["red"])
+            self._start_btn.config(state=tk.NORMAL)
             return
 
         # Request a sensible resolution; the driver may not honour it exactly
-        self._cap.set(cv2.CAP_PROP_FRAME_WIDTH,  _VIDEO_W)
-        self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, _VIDEO_H)
+        self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))  # cheaper to decode
+        self._cap.set(cv2.CAP_PROP_FRAME_WIDTH,  _CAP_W)
+        self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, _CAP_H)
         self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)   # flush stale frames fast
 
+        # Size the ping-pong buffers to what the driver actually delivers
+        cap_w = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or _CAP_W
+        cap_h = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or _CAP_H
+        self._frame_bufs = [np.empty((cap_h, cap_w, 3), np.uint8) for _ in range(2)]
+        for free, ready in zip(self._buf_free, self._buf_ready):
+            free.set()
+            ready.clear()
+
         self._running = True
         self._set_status(text="Camera Running", color=_C["green"])
-        self._start_btn.config(state=tk.DISABLED)
         self._stop_btn.config(state=tk.NORMAL)
         self._shot_btn.config(state=tk.NORMAL)
-        self._statusbar.config(text=f"Running  |  model: {model_name}")
+        self._statusbar.config(text=f"Running  |  model: {model_name}  |  "
+                                    f"{self._detector.backend} {precision} @ {imgsz}")
 
-        # Spawn background worker
-        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
-        self._thread.start()
+        # Spawn background workers
+        self._threads = [
+            threading.Thread(target=self._capture_loop, daemon=True),
+            threading.Thread(target=self._infer_loop, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
 
     def stop_camera(self) -> None:
-        """Signal the capture thread to stop and release the webcam."""
+        """Signal the worker threads to stop and release the webcam."""
         self._running = False
+        self._shot_requested = False
 
-        if self._thread:
-            self._thread.join(timeout=3)
-            self._thread = None
+        for thread in self._threads:
+            thread.join(timeout=3)
+        self._threads = []
 
         if self._cap:
             self._cap.release()
             self._cap = None
 
         # Reset video panel to placeholder
+        self._photo_shown = False
         self._video_lbl.config(
             image="",
             text="Camera feed will appear here",
@@ -336,62 +435,108 @@ class App:
         self._statusbar.config(text="Camera stopped.")
 
     def take_screenshot(self) -> None:
-        """Write the latest annotated frame to a PNG file."""
-        if self._current_frame is None:
-            return
+        """Ask for the next annotated frame to be written to a PNG file."""
+        if self._running:
+            self._shot_requested = True
+
+    def _save_screenshot(self, frame: np.ndarray) -> None:
+        """Write an annotated BGR frame to a timestamped PNG file."""
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         fname = f"detection_{ts}.png"
         try:
-            cv2.imwrite(fname, self._current_frame)
+            cv2.imwrite(fname, frame)
             self._statusbar.config(text=f"Screenshot saved: {fname}")
         except Exception as exc:
             messagebox.showerror("Screenshot Error", f"Could not save file:\n{exc}")
 
     # ══════════════════════════════════════════════════════════════════════════
-    # Background capture thread
+    # Background capture / inference threads
     # ══════════════════════════════════════════════════════════════════════════
 
     def _capture_loop(self) -> None:
         """
         Runs entirely in the capture thread.
 
-        Reads frames from the webcam, runs YOLO inference, and enqueues
-        ``(rgb_frame, detections, fps)`` tuples for the GUI to consume.
-        Old frames are dropped silently when the queue is full so the
-        display stays as fresh as the hardware allows.
+        Grabs frames from the webcam continuously and decodes one into the
+        next ping-pong buffer as soon as the inference thread has released
+        that buffer. Frames that arrive while both buffers are busy are only
+        grabbed, never decoded.
+        The thread is pinned to its own core so it keeps a steady cadence.
         """
+        self._pin_thread()
+
+        idx = 0
+
         while self._running:
             if self._cap is None or not self._cap.isOpened():
                 break
 
-            ok, frame = self._cap.read()
+            # Keep draining the driver; only the frame we hand over is decoded
+            if not self._cap.grab():
+                break
+            if not self._buf_free[idx].is_set():
+                continue
+
+            self._buf_free[idx].clear()
+            ok, frame = self._cap.retrieve(self._frame_bufs[idx])
             if not ok:
                 break
 
+            # retrieve() reallocates if the driver's frame size differs from
+            # what it reported; keep the new array so later frames reuse it
+            self._frame_bufs[idx] = frame
+            self._buf_ready[idx].set()
+            idx ^= 1
+
+    def _infer_loop(self) -> None:
+        """
+        Runs entirely in the inference thread.
+
+        Takes the ping-pong buffers in order, runs YOLO inference, and
+        publishes ``(rgbx_frame, detections, fps)`` tuples for the GUI to
+        consume. An unconsumed frame is simply replaced by the next one so
+        the display stays as fresh as the hardware allows.
+        """
+        idx = 0
+
+        while self._running:
+            if not self._buf_ready[idx].wait(timeout=0.1):
+                continue
+            self._buf_ready[idx].clear()
+
             # Detection happens here, off the main thread
-            annotated, detections, fps = self._detector.detect(frame)
-
-            # Keep a BGR copy for the screenshot feature
-            self._current_frame = annotated
-
-            # BGR → RGB for PIL/Tkinter
-            rgb = cv2.cvtColor(annotated, cv2.COLOR_BGR2RGB)
-
-            # Resize to the display panel dimensions
-            rgb = cv2.resize(rgb, (_VIDEO_W, _VIDEO_H), interpolation=cv2.INTER_LINEAR)
-
-            # Non-blocking enqueue — drop stale frame if queue is full
-            try:
-                self._queue.put_nowait((rgb, detections, fps))
-            except queue.Full:
-                try:
-                    self._queue.get_nowait()
-                except queue.Empty:
-                    pass
-                try:
-                    self._queue.put_nowait((rgb, detections, fps))
-                except queue.Full:
-                    pass  # give up for this frame
+            annotated, detections, fps = self._detector.detect(self._frame_bufs[idx])
+
+            # The frame was annotated in place in the capture buffer, so only
+            # copy it out when a screenshot has been asked for
+            if self._shot_requested:
+                self._shot_frame = annotated.copy()
+                self._shot_requested = False
+
+            # Fit the frame to the video panel, keeping its aspect ratio. When
+            # it already fits exactly (the default layout) there is no resize
+            # at all; otherwise resize first so the colour conversion only
+            # touches display-sized pixels. Either way BGR → RGBX goes
+            # straight into the next display buffer for PIL/Tkinter.
+            fh, fw = annotated.shape[:2]
+            scale = min(self._display_size[0] / fw, self._display_size[1] / fh)
+            w, h = max(int(fw * scale), 1), max(int(fh * scale), 1)
+            rgbx = self._next_display_buf(w, h)
+            if (w, h) == (fw, fh):
+                cv2.cvtColor(annotated, cv2.COLOR_BGR2RGBA, dst=rgbx)
+            else:
+                if self._scaled_buf.shape[:2] != (h, w):
+                    self._scaled_buf = np.empty((h, w, 3), np.uint8)
+                interp = cv2.INTER_LINEAR if scale > 1.0 else cv2.INTER_AREA
+                cv2.resize(annotated, (w, h), dst=self._scaled_buf, interpolation=interp)
+                cv2.cvtColor(self._scaled_buf, cv2.COLOR_BGR2RGBA, dst=rgbx)
+
+            # Hand the capture buffer back now that nothing reads it any more
+            self._buf_free[idx].set()
+            idx ^= 1
+
+            # Thread-safe publish; maxlen=1 evicts any frame the GUI missed
+            self._latest.append((rgbx, detections, fps))
 
     # ══════════════════════════════════════════════════════════════════════════
     # GUI frame consumer (runs on main thread via after())
@@ -405,19 +550,29 @@ class App:
         """
         Called every ``_POLL_MS`` ms on the main thread.
 
-        Drains the latest frame from the queue, converts it to a
+        Takes the latest frame from the single-slot deque, converts it to a
         ``PhotoImage``, and updates the video label plus stats widgets.
+        Also writes out a requested screenshot once its frame is ready.
         """
+        if self._shot_frame is not None:
+            shot, self._shot_frame = self._shot_frame, None
+            self._save_screenshot(shot)
+
         try:
-            rgb_frame, detections, fps = self._queue.get_nowait()
+            rgbx_frame, detections, fps = self._latest.popleft()
 
-            img   = Image.fromarray(rgb_frame)
-            photo = ImageTk.PhotoImage(image=img)
+            # Wrap the RGBX buffer in place; PhotoImage copies it into Tk
+            h, w  = rgbx_frame.shape[:2]
+            img   = Image.frombuffer("RGBX", (w, h), rgbx_frame, "raw", "RGBX", 0, 1)
+            if (self._photo.width(), self._photo.height()) == (w, h):
+                self._photo.paste(img)
+            else:
+                self._photo = ImageTk.PhotoImage(image=img)
+                self._photo_shown = False
 
-            # PhotoImage must be held by a Python variable; otherwise the
-            # garbage collector deletes it before Tkinter can render it.
-            self._video_lbl.config(image=photo, text="")
-            self._video_lbl._photo_ref = photo  # type: ignore[attr-defined]
+            if not self._photo_shown:
+                self._video_lbl.config(image=self._photo, text="")
+                self._photo_shown = True
 
             self._fps_lbl.config(text=f"FPS: {fps:5.1f}")
             self._obj_lbl.config(text=f"Objects: {len(detections)}")
@@ -425,7 +580,7 @@ class App:
             if detections:
                 self._append_log(detections)
 
-        except queue.Empty:
+        except IndexError:
             pass  # Nothing new this tick — that's fine
 
         # Reschedule unconditionally so the loop never stops
@@ -435,17 +590,27 @@ class App:
     # Helpers
     # ══════════════════════════════════════════════════════════════════════════
 
+    def _next_display_buf(self, w: int, h: int) -> np.ndarray:
+        """Return the next RGBX display buffer, reallocated if not *w* × *h*."""
+        buf = self._rgbx_bufs[self._buf_idx]
+        if buf.shape[:2] != (h, w):
+            buf = self._rgbx_bufs[self._buf_idx] = np.empty((h, w, 4), np.uint8)
+        self._buf_idx = (self._buf_idx + 1) % _N_BUFS
+        return buf
+
     def _set_status(self, *, text: str, color: str) -> None:
         self._status_dot.config(fg=color)
         self._status_txt.config(text=text, fg=color)
 
     def _append_log(self, detections: list[tuple]) -> None:
-        """Add the current detection batch to the scrollable log."""
+        """Add the current detection batch to the scrollable log (at most every ``_LOG_S``)."""
+        now = time.perf_counter()
+        if now - self._last_log_ts < _LOG_S:
+            return
+        self._last_log_ts = now
+
         ts    = datetime.now().strftime("%H:%M:%S")
-        lines = [f"[{ts}]"]
-        for label, conf, _ in detections:
-            lines.append(f"  {label}: {conf:.2%}")
-        entry = "\n".join(lines) + "\n"
+        entry = f"[{ts}]\n" + "".join(f"  {label}: {conf:.2%}\n" for label, conf, _ in detections)
 
         self._log.config(state=tk.NORMAL)
         self._log.insert(tk.END, entry)
@@ -457,6 +622,53 @@ class App:
 
         self._log.config(state=tk.DISABLED)
 
+    @staticmethod
+    def _pin_thread() -> None:
+        """
+        Pin the calling thread to the highest CPU core the process may use
+        and raise its priority.
+
+        Best effort: unsupported platforms and missing permissions (raising
+        priority usually needs admin/root) are silently ignored.
+        """
+        try:
+            if sys.platform == "win32":
+                from ctypes import wintypes
+
+                # Private handle with explicit prototypes: masks are pointer
+                # sized, and ctypes would otherwise truncate them to a C int
+                kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+                kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+                kernel32.GetCurrentThread.restype = wintypes.HANDLE
+                kernel32.GetProcessAffinityMask.argtypes = (
+                    wintypes.HANDLE, ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(ctypes.c_size_t))
+                kernel32.SetThreadAffinityMask.argtypes = (wintypes.HANDLE, ctypes.c_size_t)
+                kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t
+                kernel32.SetThreadPriority.argtypes = (wintypes.HANDLE, ctypes.c_int)
+
+                proc_mask, sys_mask = ctypes.c_size_t(), ctypes.c_size_t()
+                if not kernel32.GetProcessAffinityMask(kernel32.GetCurrentProcess(),
+                                                       ctypes.byref(proc_mask),
+                                                       ctypes.byref(sys_mask)):
+                    raise ctypes.WinError(ctypes.get_last_error())
+
+                handle = kernel32.GetCurrentThread()
+                if bin(proc_mask.value).count("1") > 1:
+                    # Highest core the process is allowed to run on
+                    core_mask = 1 << (proc_mask.value.bit_length() - 1)
+                    if not kernel32.SetThreadAffinityMask(handle, core_mask):
+                        raise ctypes.WinError(ctypes.get_last_error())
+                if not kernel32.SetThreadPriority(handle, 1):  # THREAD_PRIORITY_ABOVE_NORMAL
+                    raise ctypes.WinError(ctypes.get_last_error())
+            elif hasattr(os, "sched_setaffinity"):
+                # On Linux pid 0 / nice() act on the calling thread only
+                allowed = os.sched_getaffinity(0)
+                if len(allowed) > 1:
+                    os.sched_setaffinity(0, {max(allowed)})
+                os.nice(-5)
+        except (OSError, AttributeError):
+            pass
+
     @staticmethod
     def _labeled_frame(parent: tk.Widget, title: str) -> tk.LabelFrame:
         return tk.LabelFrame(
@@ -8,11 +8,47 @@ This module is intentionally decoupled from any GUI code so it can be
 tested independently or swapped out for a different model family.
 """
 
+import hashlib
+import importlib.util
+import os
+import re
+import shutil
 import time
+from pathlib import Path
+from typing import Any
 
 import cv2
 import numpy as np
-from ultralytics import YOLO
+import torch
+
+# Ultralytics pip-installs missing export dependencies (tensorrt, openvino, …) on
+# the fly by default. They are optional here, so only use what is already
+# installed unless the user opts back in with YOLO_AUTOINSTALL=true.
+os.environ.setdefault("YOLO_AUTOINSTALL", "false")
+
+from ultralytics import YOLO  # noqa: E402
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; box packing falls back to NumPy
+    _HAS_NUMBA = False
+
+_IOU    = 0.45          # NMS IoU threshold
+_MIN_CONF = 0.05        # Lowest confidence threshold the detector accepts
+_CALIB_DATA = "coco128.yaml"  # INT8 calibration images (128 COCO images, auto-downloaded)
+_TXT_CACHE_MAX = 1000   # Label chip sizes remembered before the oldest is evicted
+_MIN_BOX_PX = 4         # Boxes this narrow or short (after clipping) are not drawn
+
+# Python packages each export format needs at export and inference time,
+# plus what its INT8 quantisation needs on top
+_EXPORT_RUNTIMES: dict[str, tuple[str, ...]] = {
+    "engine":   ("tensorrt",),
+    "openvino": ("openvino",),
+}
+_INT8_RUNTIMES: dict[str, tuple[str, ...]] = {
+    "openvino": ("nncf",),
+}
 
 # ── Colour palette for bounding boxes (one colour per class, cycling) ─────────
 _PALETTE = [
@@ -21,18 +57,81 @@ _PALETTE = [
     (173,   3, 255), (255,  99,  71),
 ]
 
+# ── Box packing (JIT-compiled when numba is installed) ─────────────────────────
+# One record per drawable box; .tolist() turns it into plain Python tuples in C
+_DET_DTYPE = np.dtype([("x1", np.int32), ("y1", np.int32), ("x2", np.int32), ("y2", np.int32),
+                       ("conf", np.float32), ("cls", np.int32)])
+
+
+def _pack_boxes_loop(xyxy: np.ndarray, confs: np.ndarray, classes: np.ndarray,
+                     min_px: int) -> np.ndarray:
+    """Pack boxes wider and taller than *min_px* into a ``_DET_DTYPE`` array."""
+    out = np.empty(len(confs), _DET_DTYPE)
+    n = 0
+    for i in range(len(confs)):
+        x1, y1, x2, y2 = xyxy[i, 0], xyxy[i, 1], xyxy[i, 2], xyxy[i, 3]
+        if x2 - x1 > min_px and y2 - y1 > min_px:
+            rec = out[n]
+            rec["x1"] = x1
+            rec["y1"] = y1
+            rec["x2"] = x2
+            rec["y2"] = y2
+            rec["conf"] = confs[i]
+            rec["cls"] = classes[i]
+            n += 1
+    return out[:n]
+
+
+def _pack_boxes_numpy(xyxy: np.ndarray, confs: np.ndarray, classes: np.ndarray,
+                      min_px: int) -> np.ndarray:
+    """Vectorised equivalent of ``_pack_boxes_loop`` for when numba is missing."""
+    keep = ((xyxy[:, 2] - xyxy[:, 0]) > min_px) & ((xyxy[:, 3] - xyxy[:, 1]) > min_px)
+    out = np.empty(int(keep.sum()), _DET_DTYPE)
+    out["x1"], out["y1"], out["x2"], out["y2"] = xyxy[keep].T
+    out["conf"] = confs[keep]
+    out["cls"] = classes[keep]
+    return out
+
+
+_pack_boxes = njit(cache=True)(_pack_boxes_loop) if _HAS_NUMBA else _pack_boxes_numpy
+
+
+def _file_digest(path: Path) -> str:
+    """Return a short SHA-256 of *path*'s contents."""
+    sha = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()[:12]
+
 
 class ObjectDetector:
     """
     Wraps a YOLOv8 model and exposes a single ``detect()`` method that
-    accepts a raw BGR frame and returns an annotated copy together with
-    structured detection results and a live FPS reading.
+    accepts a raw BGR frame, annotates it in place, and returns it together
+    with structured detection results and a live FPS reading.
     """
 
-    def __init__(self, model_name: str = "yolov8n", conf_threshold: float = 0.50):
+    PRECISIONS = ["FP32", "FP16", "INT8"]
+    IMGSZS = [320, 416, 480, 640]
+
+    def __init__(self, model_name: str = "yolov8n", conf_threshold: float = 0.50,
+                 precision: str = "FP16", imgsz: int = 640):
         self.model_name = model_name
         self.conf_threshold = conf_threshold
+        self.precision = precision
+        self.imgsz = imgsz
         self.model: YOLO | None = None
+        self.backend: str = "pytorch"
+        self.device: int | str = "cpu"
+        self.half: bool = False
+
+        # Exports that failed this session; they fall back to PyTorch
+        # straight away instead of being retried on every load
+        self._failed_exports: set[Path] = set()
+
+        # cv2.getTextSize() results keyed by label text (insertion-ordered)
+        self._txt_cache: dict[str, tuple[int, int, int]] = {}
 
         # FPS tracking
         self._fps: float = 0.0
@@ -41,21 +140,37 @@ class ObjectDetector:
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
-    def load_model(self, model_name: str | None = None) -> None:
+    def load_model(self, model_name: str | None = None, precision: str | None = None,
+                   imgsz: int | None = None) -> None:
         """
         Download (first run) and load a YOLOv8 model.
 
+        The weights are exported once per precision and input size and
+        cached next to the ``.pt`` file: to a TensorRT engine on machines
+        with CUDA, otherwise to an OpenVINO IR for CPU inference. If the
+        export or its runtime is unavailable the PyTorch weights are used.
+
         Args:
             model_name: e.g. ``"yolov8n"``, ``"yolov8s"``, ``"yolov8m"``, …
                         Falls back to ``self.model_name`` if *None*.
+            precision:  One of ``PRECISIONS``. Falls back to ``self.precision``
+                        if *None*.
+            imgsz:      Square inference size, e.g. one of ``IMGSZS``; Ultralytics
+                        letterboxes frames to it. Falls back to ``self.imgsz``
+                        if *None*.
         """
         if model_name:
             self.model_name = model_name
+        if precision:
+            self.precision = precision
+        if imgsz:
+            self.imgsz = imgsz
 
         print(f"[Detector] Loading model '{self.model_name}' …")
-        # YOLO() auto-downloads the .pt file on the first call
-        self.model = YOLO(f"{self.model_name}.pt")
-        print(f"[Detector] Model ready: {self.model_name}")
+        self.model = self._load_backend()
+        if self.backend == "pytorch":
+            self.model.fuse()   # fold Conv+BN once instead of on the first predict()
+        print(f"[Detector] Model ready: {self.model_name} ({self.backend})")
 
         # Reset FPS counters whenever a new model is loaded
         self._fps = 0.0
@@ -66,11 +181,14 @@ class ObjectDetector:
         """
         Run inference on a single BGR frame.
 
+        Boxes are drawn straight onto *frame* to avoid a full-frame copy;
+        callers that need the raw pixels afterwards must copy it first.
+
         Args:
             frame: Raw frame from ``cv2.VideoCapture``.
 
         Returns:
-            annotated_frame : BGR copy of *frame* with boxes, labels, and an FPS
+            annotated_frame : *frame* itself with boxes, labels, and an FPS
                               overlay drawn on it.
             detections      : List of ``(label, confidence, (x1, y1, x2, y2))``
                               for every detection above ``conf_threshold``.
@@ -82,21 +200,30 @@ class ObjectDetector:
         self._tick()
 
         # ── Inference ──────────────────────────────────────────────────────────
-        # verbose=False suppresses the per-frame console spam from ultralytics
-        results = self.model.predict(frame, conf=self.conf_threshold, verbose=False)
+        # verbose=False suppresses the per-frame console spam from ultralytics;
+        # augment/save are spelled out so no extra per-frame work sneaks in
+        results = self.model.predict(frame, conf=self.conf_threshold, iou=_IOU, imgsz=self.imgsz,
+                                     device=self.device, half=self.half, verbose=False,
+                                     augment=False, save=False, stream=False)
 
         # ── Render detections ──────────────────────────────────────────────────
-        annotated = frame.copy()
+        annotated = frame
         detections: list[tuple] = []
 
-        for result in results:
-            if result.boxes is None:
-                continue
-            for box in result.boxes:
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                conf = float(box.conf[0])
-                cls_id = int(box.cls[0])
-                label = result.names[cls_id]
+        result = results[0]
+        if result.boxes is not None and len(result.boxes):
+            # Pull every box off the device in one transfer per field instead
+            # of one sync per box, then iterate plain Python rows
+            xyxy = result.boxes.xyxy.cpu().numpy().astype(np.int32)
+            confs = result.boxes.conf.cpu().numpy().astype(np.float32)
+            classes = result.boxes.cls.cpu().numpy().astype(np.int32)
+            names = result.names
+
+            # Drop zero-area / off-screen slivers and pack the rest in one pass
+            packed = _pack_boxes(xyxy, confs, classes, _MIN_BOX_PX)
+
+            for x1, y1, x2, y2, conf, cls_id in packed.tolist():
+                label = names[cls_id]
                 color = _PALETTE[cls_id % len(_PALETTE)]
 
                 # Filled rectangle for the bounding box outline
@@ -104,7 +231,7 @@ class ObjectDetector:
 
                 # Semi-transparent filled background for the label chip
                 tag = f"{label}  {conf:.0%}"
-                (tw, th), bl = cv2.getTextSize(tag, cv2.FONT_HERSHEY_SIMPLEX, 0.55, 1)
+                tw, th, bl = self._text_size(tag)
                 chip_top = max(y1 - th - bl - 6, 0)
                 cv2.rectangle(annotated, (x1, chip_top), (x1 + tw + 6, y1), color, cv2.FILLED)
                 cv2.putText(
@@ -127,11 +254,114 @@ class ObjectDetector:
         return annotated, detections, self._fps
 
     def set_conf_threshold(self, value: float) -> None:
-        """Clamp and update the confidence threshold (0.05 – 0.99)."""
-        self.conf_threshold = max(0.05, min(0.99, float(value)))
+        """Clamp and update the confidence threshold (``_MIN_CONF`` – 0.99)."""
+        self.conf_threshold = max(_MIN_CONF, min(0.99, float(value)))
 
     # ── Private helpers ────────────────────────────────────────────────────────
 
+    def _load_backend(self) -> YOLO:
+        """Return the fastest model available for this machine and precision."""
+        pt_path = Path(f"{self.model_name}.pt")
+        export_args: dict[str, Any] = {"half": self.precision == "FP16",
+                                       "int8": self.precision == "INT8"}
+        if self.precision == "INT8":
+            export_args["data"] = _CALIB_DATA
+
+        if torch.cuda.is_available():
+            self.device, self.half = 0, self.precision != "FP32"
+            # nms=True bakes NMS into the engine so detections come back
+            # already filtered instead of being post-processed on the CPU.
+            # Its IoU and confidence floor are fixed at export time, so use
+            # the same IoU as predict() and the slider's lowest confidence,
+            # and key the cached engine on both.
+            export_args.update(workspace=4, nms=True, iou=_IOU, conf=_MIN_CONF)
+            fmt, backend, suffix = "engine", "tensorrt", f"_nms{_IOU:g}-{_MIN_CONF:g}.engine"
+        else:
+            self.device, self.half = "cpu", False
+            fmt, backend, suffix = "openvino", "openvino", "_openvino_model"
+
+        target: Path | None = None
+        try:
+            required = _EXPORT_RUNTIMES.get(fmt, ())
+            if self.precision == "INT8":
+                required += _INT8_RUNTIMES.get(fmt, ())
+            missing = [pkg for pkg in required if importlib.util.find_spec(pkg) is None]
+            if missing:
+                raise ModuleNotFoundError(f"{', '.join(missing)} not installed")
+
+            if not pt_path.exists():
+                YOLO(str(pt_path))  # auto-downloads the .pt file on the first call
+
+            # Key exports on the weights' content so a changed .pt is re-exported
+            digest = _file_digest(pt_path)
+            target = pt_path.with_name(f"{self.model_name}_{digest}_{self.precision.lower()}"
+                                       f"_{self.imgsz}{suffix}")
+            if target in self._failed_exports:
+                raise RuntimeError("export already failed this session")
+            if not target.exists():
+                print(f"[Detector] Exporting {backend} {self.precision} model "
+                      "(first run only, may take minutes) …")
+                self._export(pt_path, target, fmt, digest, export_args)
+            model = YOLO(str(target), task="detect")
+            self.backend = backend
+            return model
+        except Exception as exc:
+            if target is not None:
+                self._failed_exports.add(target)
+            print(f"[Detector] {backend} unavailable, using PyTorch weights: {exc}")
+            self.backend = "pytorch"
+            return YOLO(str(pt_path))
+
+    def _export(self, pt_path: Path, target: Path, fmt: str, digest: str,
+                export_args: dict[str, Any]) -> None:
+        """Export *pt_path* to *target*, reusing a cached INT8 calibration table."""
+        # The TensorRT exporter reads and writes its calibration cache next to
+        # the weights; keep it keyed by the weights' hash and input size so
+        # INT8 engines for the same weights and size are never calibrated
+        # twice, and a table is never reused for a different input size
+        calib = pt_path.with_suffix(".cache")
+        keyed_calib = pt_path.with_name(f"{self.model_name}_{digest}_{self.imgsz}.cache")
+        if export_args["int8"]:
+            calib.unlink(missing_ok=True)
+            if keyed_calib.exists():
+                shutil.copyfile(keyed_calib, calib)
+
+        # The TensorRT exporter goes through an ONNX file it leaves behind
+        onnx = pt_path.with_suffix(".onnx")
+        keep_onnx = onnx.exists()
+
+        exported = YOLO(str(pt_path)).export(format=fmt, imgsz=self.imgsz, device=self.device,
+                                             **export_args)
+        Path(exported).rename(target)
+
+        if export_args["int8"] and calib.exists():
+            calib.replace(keyed_calib)
+        if not keep_onnx:
+            onnx.unlink(missing_ok=True)
+        self._remove_stale_exports(pt_path.parent, digest)
+
+    def _remove_stale_exports(self, folder: Path, digest: str) -> None:
+        """Delete exports and calibration tables built from other weights of this model."""
+        stale = re.compile(rf"{re.escape(self.model_name)}_(?!{digest}_)[0-9a-f]{{12}}_")
+        for path in folder.glob(f"{self.model_name}_*"):
+            if not stale.match(path.name):
+                continue
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+    def _text_size(self, tag: str) -> tuple[int, int, int]:
+        """Return ``(width, height, baseline)`` of a label chip, memoised per tag."""
+        size = self._txt_cache.get(tag)
+        if size is None:
+            (tw, th), bl = cv2.getTextSize(tag, cv2.FONT_HERSHEY_SIMPLEX, 0.55, 1)
+            size = (tw, th, bl)
+            if len(self._txt_cache) >= _TXT_CACHE_MAX:
+                del self._txt_cache[next(iter(self._txt_cache))]
+            self._txt_cache[tag] = size
+        return size
+
     def _tick(self) -> None:
         """Update the rolling FPS counter once per second."""
         self._frame_count += 1